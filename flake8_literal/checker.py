@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import tokenize
 from abc import abstractproperty
-from typing import ClassVar, TYPE_CHECKING, Tuple
+from typing import ClassVar, NamedTuple, TYPE_CHECKING, Tuple
 
 from typing_extensions import Protocol
 
@@ -32,8 +32,18 @@ IGNORE_TOKENS = frozenset((
 	tokenize.COMMENT,
 ))
 
-OPEN_BRACKET = frozenset(('(', '[', '{'))
-CLOSE_BRACKET = frozenset((')', ']', '}'))
+QUOTES = frozenset(("'", '"'))
+
+BRACKET_DEPTH = {
+	'(': 1,
+	'[': 1,
+	'{': 1,
+	')': -1,
+	']': -1,
+	'}': -1,
+}
+
+DEFINITION_KEYWORDS = frozenset(('class', 'def'))
 
 
 class Options(Protocol):
@@ -53,6 +63,30 @@ class Message(Protocol):
 		...
 
 
+class StringLiteral(NamedTuple):
+	"""Parsed string literal token."""
+
+	prefix: str
+	quote: str
+	multiline: bool
+	contents: str
+	stripped: str  # contents with escaped slashes removed
+
+	@classmethod
+	def from_token(cls, token: tokenize.TokenInfo) -> StringLiteral:
+		string = token.string
+		quote = string[-1]
+		if (string[0] in QUOTES):
+			prefix = ''
+		else:  # prefixes are at most two characters
+			prefix = string[:1 if (string[1] in QUOTES) else 2].lower()
+			string = string[len(prefix):]
+		multiline = (string[0:3] == (quote * 3))
+		contents = string[3:-3] if (multiline) else string[1:-1]
+		return cls(prefix=prefix, quote=quote, multiline=multiline,
+		           contents=contents, stripped=contents.replace(r'\\', ''))
+
+
 LogicalResult = Tuple[Tuple[int, int], str]  # (line, column), text
 PhysicalResult = Tuple[int, str]  # (column, text)
 ASTResult = Tuple[int, int, str, type]  # (line, column, text, type)
@@ -83,64 +117,54 @@ class Checker:
 
 
 class LiteralChecker(Checker):
-	"""Base class for literal checkers."""
+	"""Base class for literal checkers, tokens are those of a single logical line."""
 
+	logical_line: str
 	tokens: Sequence[tokenize.TokenInfo]
-	_docstring_tokens: (frozenset[tokenize.TokenInfo] | None)
 
 	def __init__(self, logical_line: str, tokens: Sequence[tokenize.TokenInfo]) -> None:
-		self.tokens = tokens
-		self._docstring_tokens = None
-
-	@property
-	def docstring_tokens(self) -> frozenset[tokenize.TokenInfo]:
-		"""Find docstring tokens, which are initial strings or strings immediately after class or function defs."""
-		if (self._docstring_tokens is None):
-			docstrings: set[tokenize.TokenInfo] = set()
-			expect_docstring = True
-			expect_colon = False
-			bracket_depth = 0
-			for token in self.tokens:
-				if (token.type in IGNORE_TOKENS):
-					continue
-				if (tokenize.STRING == token.type):
-					if (expect_docstring):
-						docstrings.add(token)
-				else:
-					expect_docstring = False
-					if ((tokenize.NAME == token.type) and (token.string in ('class', 'def'))):
-						expect_colon = True
-						bracket_depth = 0
-					elif (tokenize.OP == token.type):
-						if (':' == token.string):
-							if (0 == bracket_depth):
-								if (expect_colon):
-									expect_docstring = True
-								expect_colon = False
-						elif (token.string in OPEN_BRACKET):
-							bracket_depth += 1
-						elif (token.string in CLOSE_BRACKET):
-							bracket_depth -= 1
-			self._docstring_tokens = frozenset(docstrings)
-		return self._docstring_tokens
-
-	def _process_literals(self, tokens: Sequence[tokenize.TokenInfo]) -> Iterator[LogicalResult]:
+		self.logical_line = logical_line
+		self.tokens = [token for token in tokens if (token.type not in IGNORE_TOKENS)]
+
+	def _process_literals(self, tokens: Sequence[tokenize.TokenInfo], docstrings: Sequence[bool]) -> Iterator[LogicalResult]:
 		raise NotImplementedError()
 
 	def __iter__(self) -> Iterator[LogicalResult]:
-		"""Primary call from flake8, yield error messages."""
+		"""Primary call from flake8, yield error messages.
+
+		Docstrings are found in the same pass, they are initial strings or strings immediately after class or function defs.
+		"""
+		definitions = any((keyword in self.logical_line) for keyword in DEFINITION_KEYWORDS)  # else only initial strings
+		expect_docstring = True
+		expect_colon = False
+		bracket_depth = 0
 		continuation: list[tokenize.TokenInfo] = []
+		docstrings: list[bool] = []
 		for token in self.tokens:
-			if (token.type in IGNORE_TOKENS):
-				continue
-
-			if (tokenize.STRING == token.type):
+			token_type = token.type
+			if (tokenize.STRING == token_type):
 				continuation.append(token)
+				docstrings.append(expect_docstring)
 				continue
 
-			for message in self._process_literals(continuation):
-				yield message
-			continuation = []
+			if (continuation):
+				for message in self._process_literals(continuation, docstrings):
+					yield message
+				continuation = []
+				docstrings = []
+
+			expect_docstring = False
+			if (not definitions):
+				continue
+			if (tokenize.OP == token_type):
+				if ((':' == token.string) and (0 == bracket_depth)):
+					expect_docstring = expect_colon
+					expect_colon = False
+				else:
+					bracket_depth += BRACKET_DEPTH.get(token.string, 0)
+			elif ((tokenize.NAME == token_type) and (token.string in DEFINITION_KEYWORDS)):
+				expect_colon = True
+				bracket_depth = 0
 
-		for message in self._process_literals(continuation):
+		for message in self._process_literals(continuation, docstrings):
 			yield message
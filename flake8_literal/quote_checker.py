@@ -35,12 +35,11 @@ class Message(enum.Enum):
 	UNNECESSARY_RAW = (21, 'Remove raw prefix when not using escapes')
 	USE_RAW_PREFIX = (22, 'Use raw prefix to avoid escaped slash')
 
-	@property
-	def code(self) -> str:
-		return (flake8_literal.quote_checker_prefix + str(self.value[0]).rjust(6 - len(flake8_literal.quote_checker_prefix), '0'))
+	def __init__(self, number: int, text: str) -> None:
+		self.code = (flake8_literal.quote_checker_prefix + str(number).rjust(6 - len(flake8_literal.quote_checker_prefix), '0'))
 
 	def text(self, **kwargs) -> str:
-		return self.value[1].format(**kwargs)
+		return self.value[1].format(**kwargs) if (kwargs) else self.value[1]
 
 
 class QuoteType(enum.Enum):
@@ -51,10 +50,10 @@ class QuoteType(enum.Enum):
 
 	@classmethod
 	def from_str(cls, value: str) -> (QuoteType | None):
-		for member in cls.__members__.values():
-			if (value.lower() == member.value):
-				return member
-		return None
+		try:
+			return cls(value.lower())
+		except ValueError:
+			return None
 
 
 QUOTE = {
@@ -126,10 +125,43 @@ class Config(NamedTuple):
 	avoid_escape: bool
 
 
+class Rules(NamedTuple):
+	"""Quotes and messages for the configured quote types."""
+
+	inline_quote: str
+	other_quote: str
+	multiline_quote: str
+	docstring_quote: str
+	use_quote_message: Message
+	avoid_escape_message: Message
+	unnecessary_escape_message: Message
+	unnecessary_other_escape_message: Message
+	match_continuation_message: Message
+	multiline_use_quote_message: Message
+	docstring_use_quote_message: Message
+	docstring_use_triple_message: Message
+
+	@classmethod
+	def from_config(cls, config: Config) -> Rules:
+		return cls(inline_quote=QUOTE[config.inline],
+		           other_quote=OTHER_QUOTE[config.inline],
+		           multiline_quote=QUOTE[config.multiline],
+		           docstring_quote=QUOTE[config.docstring],
+		           use_quote_message=USE_QUOTE_MESSAGE[config.inline],
+		           avoid_escape_message=AVOID_ESCAPE_MESSAGE[config.inline],
+		           unnecessary_escape_message=UNNECESSARY_ESCAPE_MESSAGE[config.inline],
+		           unnecessary_other_escape_message=UNNECESSARY_OTHER_ESCAPE_MESSAGE[config.inline],
+		           match_continuation_message=MATCH_CONTINUATION_MESSAGE[config.inline],
+		           multiline_use_quote_message=MULTILINE_USE_QUOTE_MESSAGE[config.multiline],
+		           docstring_use_quote_message=DOCSTRING_USE_QUOTE_MESSAGE[config.docstring],
+		           docstring_use_triple_message=DOCSTRING_USE_TRIPLE_MESSAGE[config.docstring])
+
+
 class QuoteChecker(checker.LiteralChecker):
 	"""Check string literals for proper quotes."""
 
 	config: ClassVar[Config]
+	rules: ClassVar[Rules]
 
 	@classmethod
 	def add_options(cls, option_manager: OptionManager) -> None:
@@ -165,64 +197,67 @@ class QuoteChecker(checker.LiteralChecker):
 		                    multiline=QuoteType.from_str(options.literal_multiline) or QuoteType.SINGLE,
 		                    docstring=QuoteType.from_str(options.literal_docstring) or QuoteType.DOUBLE,
 		                    avoid_escape=options.literal_avoid_escape)
+		cls.rules = Rules.from_config(cls.config)
 
-	def _process_literals(self, tokens: Sequence[tokenize.TokenInfo]) -> Iterator[tuple[tuple[int, int], str]]:
+	def _process_literals(self, tokens: Sequence[tokenize.TokenInfo], docstrings: Sequence[bool]) -> Iterator[tuple[tuple[int, int], str]]:
 		if (not tokens):
 			return
 
-		desired = QUOTE[self.config.inline]
-		other = OTHER_QUOTE[self.config.inline]
+		rules = self.rules
+		desired = rules.inline_quote
+		other = rules.other_quote
+		if (1 == len(tokens)):  # fast path for lone inline string with desired quotes and no escapes or other quotes
+			string = tokens[0].string
+			if ((not docstrings[0]) and (desired == string[0] == string[-1]) and ('\\' not in string) and (other not in string) and (string[0:3] != (desired * 3))):
+				return
+
+		avoid_escape = self.config.avoid_escape
 		needs_other = False
 		cant_switch = False
-		should_switch = set()
+		candidates = []  # tokens to switch to match other quotes in continuation
 		others = []
-		for token in tokens:
-			quote = token.string[-1]
-			prefix = token.string[:token.string.index(quote)].lower()
-			string = token.string[len(prefix):]
+		for token, docstring in zip(tokens, docstrings):
+			literal = checker.StringLiteral.from_token(token)
+			quote = literal.quote
+			contents = literal.contents
 
-			if (token in self.docstring_tokens):  # docstring
-				if ((quote == QUOTE[self.config.docstring]) and (string[0:3] == (quote * 3))):
+			if (docstring):  # docstring
+				if ((quote == rules.docstring_quote) and literal.multiline):
 					continue
-				if (quote == QUOTE[self.config.docstring]):
-					yield self._logical_token_message(token, DOCSTRING_USE_TRIPLE_MESSAGE[self.config.docstring])
+				if (quote == rules.docstring_quote):
+					yield self._logical_token_message(token, rules.docstring_use_triple_message)
 				else:
-					yield self._logical_token_message(token, DOCSTRING_USE_QUOTE_MESSAGE[self.config.docstring])
+					yield self._logical_token_message(token, rules.docstring_use_quote_message)
 
-			elif (string[0:3] == (quote * 3)):  # multiline
-				if (quote == QUOTE[self.config.multiline]):
+			elif (literal.multiline):  # multiline
+				if (quote == rules.multiline_quote):
 					continue
-				yield self._logical_token_message(token, MULTILINE_USE_QUOTE_MESSAGE[self.config.multiline])
+				yield self._logical_token_message(token, rules.multiline_use_quote_message)
 
 			else:  # inline
-				contents = string[1:-1]
-
 				if (quote == desired):  # check for escapes
-					if ((not self.config.avoid_escape) or ('r' in prefix)):
-						continue
-					if (other in contents):
-						cant_switch = True
-					if ((desired in contents) and (other in contents)):
-						continue  # both quotes used, nothing to do
-					if (desired in contents):
-						needs_other = True
-						should_switch.add(token)
-						yield self._logical_token_message(token, AVOID_ESCAPE_MESSAGE[self.config.inline])
-					if ((other in contents) and (('\\' + other) in contents.replace(r'\\', ''))):
-						yield self._logical_token_message(token, UNNECESSARY_ESCAPE_MESSAGE[self.config.inline])
+					if (avoid_escape and ('r' not in literal.prefix)):
+						has_desired = (desired in contents)
+						has_other = (other in contents)
+						if (has_other):
+							cant_switch = True
+							if ((not has_desired) and (('\\' + other) in literal.stripped)):
+								yield self._logical_token_message(token, rules.unnecessary_escape_message)
+						elif (has_desired):
+							needs_other = True
+							yield self._logical_token_message(token, rules.avoid_escape_message)
+							continue
+					candidates.append(token)
 				else:
-					if ((desired in contents) and (other not in contents) and self.config.avoid_escape):
-						if (('\\' + desired) in contents.replace(r'\\', '')):
-							yield self._logical_token_message(token, UNNECESSARY_OTHER_ESCAPE_MESSAGE[self.config.inline])
+					if (avoid_escape and (desired in contents) and (other not in contents)):
+						if (('\\' + desired) in literal.stripped):
+							yield self._logical_token_message(token, rules.unnecessary_other_escape_message)
 						needs_other = True
 						continue
 					others.append(token)
 		if ((1 < len(tokens)) and needs_other and (not cant_switch)):
-			for token in tokens:
-				quote = token.string[-1]
-				if ((quote != desired) or (token.string[-3:] == (quote * 3)) or (token in should_switch)):
-					continue
-				yield self._logical_token_message(token, MATCH_CONTINUATION_MESSAGE[self.config.inline])
+			for token in candidates:
+				yield self._logical_token_message(token, rules.match_continuation_message)
 		else:
 			for token in others:
-				yield self._logical_token_message(token, USE_QUOTE_MESSAGE[self.config.inline])
+				yield self._logical_token_message(token, rules.use_quote_message)
@@ -23,12 +23,11 @@ class Message(enum.Enum):
 	USE_RAW_FOR_SLASH = (2, 'Use raw prefix to avoid escaped slash')
 	USE_RAW_FOR_REGEX = (3, 'Use raw prefix for re pattern')
 
-	@property
-	def code(self) -> str:
-		return (flake8_literal.raw_checker_prefix + str(self.value[0]).rjust(6 - len(flake8_literal.raw_checker_prefix), '0'))
+	def __init__(self, number: int, text: str) -> None:
+		self.code = (flake8_literal.raw_checker_prefix + str(number).rjust(6 - len(flake8_literal.raw_checker_prefix), '0'))
 
 	def text(self, **kwargs) -> str:
-		return self.value[1].format(**kwargs)
+		return self.value[1].format(**kwargs) if (kwargs) else self.value[1]
 
 
 class RePatternRaw(enum.Enum):
@@ -40,10 +39,10 @@ class RePatternRaw(enum.Enum):
 
 	@classmethod
 	def from_str(cls, value: str) -> (RePatternRaw | None):
-		for member in cls.__members__.values():
-			if (value.lower() == member.value):
-				return member
-		return None
+		try:
+			return cls(value.lower())
+		except ValueError:
+			return None
 
 
 class Options(checker.Options):
@@ -106,7 +105,7 @@ class RawChecker(checker.Checker):
 
 	def __init__(self, tree: ast.AST, file_tokens: Sequence[tokenize.TokenInfo]) -> None:
 		super().__init__()
-		self.tokens = file_tokens
+		self.tokens = [token for token in file_tokens if (token.type not in checker.IGNORE_TOKENS)]
 		self.re_arguments = self._find_re_arguments(tree)
 
 	def _find_re_arguments(self, tree: ast.AST) -> set[tuple[int, int]]:
@@ -151,40 +150,33 @@ class RawChecker(checker.Checker):
 	def _process_literals(self, tokens: Sequence[tokenize.TokenInfo]) -> Iterator[checker.ASTResult]:
 		if (not tokens):
 			return
+		re_pattern_raw = self.config.re_pattern_raw
+		avoid_escape = self.config.avoid_escape
 		re_pattern = (tokens[0].start in self.re_arguments)
+		always_raw = (re_pattern and (RePatternRaw.ALWAYS == re_pattern_raw))
 		for token in tokens:
-			quote = token.string[-1]
-			prefix = token.string[:token.string.index(quote)].lower()
-			string = token.string[len(prefix):]
+			if ((token.string[0] in checker.QUOTES) and ('\\' not in token.string) and (not always_raw)):
+				continue  # no prefix and no escapes, nothing to check
 
-			if (string[0:3] == (quote * 3)):  # multiline
-				contents = string[3:-3]
-			else:  # inline
-				contents = string[1:-1]
+			literal = checker.StringLiteral.from_token(token)
+			contents = literal.contents
 
-			if ('r' in prefix):
-				if ((not ('\\' in contents)) and ((not re_pattern) or (RePatternRaw.AVOID == self.config.re_pattern_raw))):
+			if ('r' in literal.prefix):
+				if ((not ('\\' in contents)) and ((not re_pattern) or (RePatternRaw.AVOID == re_pattern_raw))):
 					yield self._ast_token_message(token, Message.UNNECESSARY_RAW)
 			else:
-				if ((r'\\' in contents) and ('\\' not in contents.replace(r'\\', '')) and self.config.avoid_escape):
-					trail_count = 0
-					test_contents = contents
-					while test_contents.endswith(r'\\'):
-						test_contents = test_contents[:-2]
-						trail_count += 1
+				if ((r'\\' in contents) and ('\\' not in literal.stripped) and avoid_escape):
+					trail_count = (len(contents) - len(contents.rstrip('\\'))) // 2  # all slashes are escaped here
 					if (0 == (trail_count % 2)):  # raw strings can't end in an odd number of backslashes
 						yield self._ast_token_message(token, Message.USE_RAW_FOR_SLASH)
 						continue
-				if (re_pattern and (RePatternRaw.ALWAYS == self.config.re_pattern_raw)):
+				if (always_raw):
 					yield self._ast_token_message(token, Message.USE_RAW_FOR_REGEX)
 
 	def __iter__(self) -> Iterator[checker.ASTResult]:
 		"""Primary call from flake8, yield error messages."""
 		continuation: list[tokenize.TokenInfo] = []
 		for token in self.tokens:
-			if (token.type in checker.IGNORE_TOKENS):
-				continue
-
 			if (tokenize.STRING == token.type):
 				continuation.append(token)
 				continue